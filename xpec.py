@@ -1,12 +1,23 @@
 import platform
+import shlex
 import subprocess
-import psutil
+import ctypes
 import webbrowser
 from datetime import datetime
 import os
 import re
 import json
+import glob
+import io
+import struct
 import sys
+import functools
+import queue
+import collections
+import threading
+import time
+import concurrent.futures
+import dataclasses
 
 # Optional image generation deps
 try:
@@ -22,8 +33,82 @@ if platform.system() == "Windows":
         from comtypes.client import CreateObject
     except ImportError:
         comtypes = None
-    import wmi
+    import pythoncom
+    import win32com.client
     import winreg
+    from ctypes import wintypes
+    pythoncom.CoInitialize()
+
+# Patterns used by the per-call helpers below
+_MS_CODE_RE = re.compile(r"\s*\(MS-[0-9A-F]+\)$", re.I)
+_RADEON_RE = re.compile(r"with Radeon Graphics", re.I)
+_GB_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*GB", re.I)
+_HEX6_RE = re.compile(r"#?([0-9a-fA-F]{6})")
+_RAM_SPEED_RE = re.compile(r"(\d+)")
+_RAM_CL_RE = re.compile(r"(?:C|CL)(\d{2})(?:[^0-9]|$)")
+
+WMI_CIMV2 = "root\\cimv2"
+WMI_STORAGE = "root\\Microsoft\\Windows\\Storage"
+# wbemFlagReturnImmediately | wbemFlagForwardOnly
+_WBEM_FAST_ENUM = 0x10 | 0x20
+
+# WMI can hang for seconds (or forever) on unhealthy hosts. All queries run on one
+# daemon thread that owns the COM apartment and the cached SWbemServices per
+# namespace; callers wait with a deadline and get plain dict rows back.
+_WMI_TIMEOUT_MS = 1500
+_WMI_JOBS = queue.Queue()
+_WMI_WORKER = None
+_WMI_WORKER_LOCK = threading.Lock()
+
+def _wmi_timeout() -> float:
+    # Override via env: XPEC_WMI_TIMEOUT_MS=3000
+    try:
+        ms = int(os.getenv("XPEC_WMI_TIMEOUT_MS", ""))
+    except ValueError:
+        ms = _WMI_TIMEOUT_MS
+    return max(ms, 1) / 1000.0
+
+# A cold powershell.exe plus the Storage module needs far more than one WMI query's budget
+_POWERSHELL_TIMEOUT_S = 10.0
+
+def _powershell_timeout() -> float:
+    # Still bounded, and never below what the WMI knob itself allows
+    return max(_POWERSHELL_TIMEOUT_S, 4 * _wmi_timeout())
+
+def _wmi_worker():
+    pythoncom.CoInitializeEx(0)
+    services = {}
+    while True:
+        namespace, wql, fut = _WMI_JOBS.get()
+        if not fut.set_running_or_notify_cancel():
+            continue  # caller already gave up
+        try:
+            svc = services.get(namespace)
+            if svc is None:
+                locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+                svc = services[namespace] = locator.ConnectServer(".", namespace)
+            rows = [
+                {prop.Name: prop.Value for prop in obj.Properties_}
+                for obj in svc.ExecQuery(wql, "WQL", _WBEM_FAST_ENUM)
+            ]
+            fut.set_result(rows)
+        except Exception as e:
+            fut.set_exception(e)
+
+def _wmi_query(namespace: str, wql: str) -> list:
+    """Run a WQL query with a forward-only enumerator; raises TimeoutError past the deadline."""
+    global _WMI_WORKER
+    with _WMI_WORKER_LOCK:
+        if _WMI_WORKER is None:
+            _WMI_WORKER = threading.Thread(target=_wmi_worker, name="xpec-wmi", daemon=True)
+            _WMI_WORKER.start()
+    fut = concurrent.futures.Future()
+    _WMI_JOBS.put((namespace, wql, fut))
+    try:
+        return fut.result(timeout=_wmi_timeout())
+    except concurrent.futures.TimeoutError:
+        fut.cancel()
+        raise TimeoutError(f"WMI query timed out: {wql}")
 
 def _is_debug() -> bool:
     # Enable via env: XPEC_DEBUG_MOBO=1 or XPEC_DEBUG=1
@@ -50,7 +135,16 @@ def _debug_print_gpu(msg: str):
         except Exception:
             pass
 
-def get_system_info():
+def _reg_values(key) -> dict:
+    # All values of an open registry key in one pass, instead of one QueryValueEx per name
+    values = {}
+    for i in range(winreg.QueryInfoKey(key)[1]):
+        name, val, _ = winreg.EnumValue(key, i)
+        values[name] = val
+    return values
+
+@functools.lru_cache(maxsize=1)
+def _probe_system_info():
     system_info = {}
     if platform.system() == "Windows":
         # Prefer a human-friendly motherboard name
@@ -60,23 +154,17 @@ def get_system_info():
         debug_wmi_manufacturer = debug_wmi_product = debug_wmi_version = None
         try:
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\\DESCRIPTION\\System\\BIOS") as key:
-                manu = (winreg.QueryValueEx(key, "BaseBoardManufacturer")[0] or "").strip()
-                product = (winreg.QueryValueEx(key, "BaseBoardProduct")[0] or "").strip()
-                sysprod = None
-                try:
-                    sysprod = (winreg.QueryValueEx(key, "SystemProductName")[0] or "").strip()
-                except Exception:
-                    sysprod = None
-                try:
-                    sysmanu = (winreg.QueryValueEx(key, "SystemManufacturer")[0] or "").strip()
-                except Exception:
-                    sysmanu = None
+                vals = _reg_values(key)
+                manu = str(vals.get("BaseBoardManufacturer") or "").strip()
+                product = str(vals.get("BaseBoardProduct") or "").strip()
+                sysprod = str(vals.get("SystemProductName") or "").strip() or None
+                sysmanu = str(vals.get("SystemManufacturer") or "").strip() or None
                 # Prefer BaseBoardProduct; fallback to SystemProductName only if BaseBoardProduct is empty or generic
                 bad_tokens = {"TO BE FILLED BY O.E.M.", "SYSTEM PRODUCT NAME", "DEFAULT STRING", "NOT SPECIFIED", "UNKNOWN", "N/A"}
                 product_pretty = product if product and product.upper() not in bad_tokens else (sysprod or "")
                 # Clean patterns like " (MS-7E49)"
                 if product_pretty:
-                    product_pretty = re.sub(r"\s*\(MS-[0-9A-F]+\)$", "", product_pretty, flags=re.I)
+                    product_pretty = _MS_CODE_RE.sub("", product_pretty)
                 if manu or product:
                     vendor = _short_vendor(manu)
                     mobo_name = f"{vendor} {product_pretty}".strip()
@@ -89,14 +177,14 @@ def get_system_info():
                     debug_vendor_short = vendor
         except Exception:
             pass
+        # WMI only when the registry has neither BaseBoardManufacturer nor BaseBoardProduct
         if not mobo_name:
             try:
-                c = wmi.WMI()
-                bb = c.Win32_BaseBoard()[0]
-                manu = (bb.Manufacturer or "").strip()
-                product = (bb.Product or "").strip()
+                bb = _wmi_query(WMI_CIMV2, "SELECT Manufacturer,Product,Version FROM Win32_BaseBoard")[0]
+                manu = (bb.get("Manufacturer") or "").strip()
+                product = (bb.get("Product") or "").strip()
                 try:
-                    debug_wmi_version = (bb.Version or "").strip()
+                    debug_wmi_version = (bb.get("Version") or "").strip()
                 except Exception:
                     debug_wmi_version = None
                 if manu or product:
@@ -122,33 +210,127 @@ def get_system_info():
             system_info["Debug: WMI BaseBoard.Version"] = debug_wmi_version or "N/A"
             _debug_print(f"[MOBO DEBUG] source={debug_source} | reg=({debug_reg_manu} {debug_reg_product}) sys=({debug_reg_sysmanu} {debug_reg_sysprod}) pretty={debug_product_pretty} | wmi=({debug_wmi_manufacturer} {debug_wmi_product} v{debug_wmi_version}) | chosen='{system_info['Motherboard']}'")
     else:
-        try:
-            with open("/sys/devices/virtual/dmi/id/board_vendor", "r") as f:
-                manu = f.read().strip()
-            with open("/sys/devices/virtual/dmi/id/board_name", "r") as f:
-                product = f.read().strip()
-            system_info["Motherboard"] = f"{manu} {product}".strip()
-            if _is_debug():
-                system_info["Debug: Linux board_vendor"] = manu or "N/A"
-                system_info["Debug: Linux board_name"] = product or "N/A"
-                _debug_print(f"[MOBO DEBUG] linux board_vendor='{manu}' board_name='{product}' chosen='{system_info['Motherboard']}'")
-        except FileNotFoundError:
-            system_info["Motherboard"] = "N/A"
+        dmi = {}
+        for name in ("board_vendor", "board_name", "sys_vendor", "product_name"):
+            try:
+                with open(f"/sys/devices/virtual/dmi/id/{name}", "r") as f:
+                    dmi[name] = f.read().strip()
+            except OSError:
+                dmi[name] = ""
+        manu, product = dmi["board_vendor"], dmi["board_name"]
+        # Some boards leave the baseboard fields empty; fall back to the system product
+        if not (manu or product):
+            manu, product = dmi["sys_vendor"], dmi["product_name"]
+        system_info["Motherboard"] = f"{manu} {product}".strip() or "N/A"
+        if _is_debug():
+            for name, value in dmi.items():
+                system_info[f"Debug: Linux {name}"] = value or "N/A"
+            _debug_print(f"[MOBO DEBUG] linux board=({dmi['board_vendor']} {dmi['board_name']}) sys=({dmi['sys_vendor']} {dmi['product_name']}) chosen='{system_info['Motherboard']}'")
 
     system_info["OS"] = f"{platform.system()} {platform.release()}"
     return system_info
 
-def get_cpu_info():
+_CPUINFO_MODEL_RE = re.compile(rb"^model name[ \t]*:[ \t]*(.*)$", re.M)
+# physical id ... core id within one processor block (never running into the next one)
+_CPUINFO_CORE_RE = re.compile(rb"^physical id[ \t]*:[ \t]*(\d+)$(?:(?!^processor\b).)*?^core id[ \t]*:[ \t]*(\d+)$", re.M | re.S)
+_CPUINFO_CORES_RE = re.compile(rb"^cpu cores[ \t]*:[ \t]*(\d+)$", re.M)
+
+def _sysfs_core_count():
+    """Count physical cores from sysfs topology (ARM kernels omit core ids in /proc/cpuinfo)."""
+    # Each core lists the same sibling set for all its threads; distinct sets = cores
+    for name in ("core_cpus_list", "thread_siblings_list"):
+        siblings = set()
+        for path in glob.glob(f"/sys/devices/system/cpu/cpu[0-9]*/topology/{name}"):
+            try:
+                with open(path, "r") as f:
+                    siblings.add(f.read().strip())
+            except OSError:
+                continue
+        if siblings:
+            return len(siblings)
+    return None
+
+def _win_cpu_counts():
+    """Return (physical cores, logical processors) from kernel32 without WMI."""
+    k32 = ctypes.windll.kernel32
+    relation_processor_core = 0
+    length = wintypes.DWORD(0)
+    k32.GetLogicalProcessorInformationEx(relation_processor_core, None, ctypes.byref(length))
+    cores = threads = 0
+    if length.value:
+        buf = ctypes.create_string_buffer(length.value)
+        if k32.GetLogicalProcessorInformationEx(relation_processor_core, buf, ctypes.byref(length)):
+            # SYSTEM_LOGICAL_PROCESSOR_INFORMATION_EX: Relationship, Size, then PROCESSOR_RELATIONSHIP
+            # (Flags, EfficiencyClass, Reserved[20], GroupCount, GroupMask[GroupCount])
+            ptr_size = ctypes.sizeof(ctypes.c_void_p)
+            mask_fmt = "<Q" if ptr_size == 8 else "<I"
+            affinity_size = ptr_size + 8
+            off = 0
+            while off < length.value:
+                rel, size = struct.unpack_from("<II", buf, off)
+                if not size:
+                    break
+                if rel == relation_processor_core:
+                    cores += 1
+                    group_count = struct.unpack_from("<H", buf, off + 30)[0]
+                    for g in range(group_count):
+                        mask = struct.unpack_from(mask_fmt, buf, off + 32 + g * affinity_size)[0]
+                        threads += bin(mask).count("1")
+                off += size
+    if not threads:
+        class SYSTEM_INFO(ctypes.Structure):
+            _fields_ = [
+                ("wProcessorArchitecture", wintypes.WORD),
+                ("wReserved", wintypes.WORD),
+                ("dwPageSize", wintypes.DWORD),
+                ("lpMinimumApplicationAddress", ctypes.c_void_p),
+                ("lpMaximumApplicationAddress", ctypes.c_void_p),
+                ("dwActiveProcessorMask", ctypes.c_size_t),
+                ("dwNumberOfProcessors", wintypes.DWORD),
+                ("dwProcessorType", wintypes.DWORD),
+                ("dwAllocationGranularity", wintypes.DWORD),
+                ("wProcessorLevel", wintypes.WORD),
+                ("wProcessorRevision", wintypes.WORD),
+            ]
+        si = SYSTEM_INFO()
+        k32.GetNativeSystemInfo(ctypes.byref(si))
+        threads = int(si.dwNumberOfProcessors)
+    return cores or None, threads or None
+
+@functools.lru_cache(maxsize=1)
+def _probe_cpu_info():
     cpu_info = {}
     if platform.system() == "Windows":
+        # Registry + kernel32 first; both are immutable and avoid a WMI/COM session
+        model = mhz = cores = threads = None
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, "HARDWARE\\DESCRIPTION\\System\\CentralProcessor\\0") as key:
+                vals = _reg_values(key)
+                model = str(vals.get("ProcessorNameString") or "").strip() or None
+                try:
+                    mhz = float(vals["~MHz"])
+                except Exception:
+                    mhz = None
+        except Exception:
+            pass
+        try:
+            cores, threads = _win_cpu_counts()
+        except Exception:
+            pass
+        if model and cores:
+            cpu_info["Model"] = model
+            cpu_info["Cores"] = cores
+            cpu_info["Threads"] = threads or cores
+            if mhz:
+                cpu_info["Max Clock"] = f"{mhz/1000:.2f} GHz"
+            return cpu_info
         try:
-            c = wmi.WMI()
-            cpu = c.Win32_Processor()[0]
-            cpu_info["Model"] = cpu.Name
-            cpu_info["Cores"] = cpu.NumberOfCores
-            cpu_info["Threads"] = cpu.NumberOfLogicalProcessors
+            cpu = _wmi_query(WMI_CIMV2, "SELECT Name,NumberOfCores,NumberOfLogicalProcessors,MaxClockSpeed FROM Win32_Processor")[0]
+            cpu_info["Model"] = cpu.get("Name")
+            cpu_info["Cores"] = cpu.get("NumberOfCores")
+            cpu_info["Threads"] = cpu.get("NumberOfLogicalProcessors")
             try:
-                mhz = float(cpu.MaxClockSpeed)
+                mhz = float(cpu.get("MaxClockSpeed"))
                 cpu_info["Max Clock"] = f"{mhz/1000:.2f} GHz"
             except Exception:
                 pass
@@ -156,16 +338,29 @@ def get_cpu_info():
             pass
     else:
         try:
-            with open("/proc/cpuinfo", "r") as f:
-                for line in f:
-                    if "model name" in line:
-                        cpu_info["Model"] = line.split(":")[1].strip()
-                        break
-            cpu_info["Cores"] = psutil.cpu_count(logical=False)
-            cpu_info["Threads"] = psutil.cpu_count(logical=True)
-            freq = psutil.cpu_freq()
-            if freq and freq.max:
-                cpu_info["Max Clock"] = f"{freq.max/1000:.2f} GHz"
+            with open("/proc/cpuinfo", "rb") as f:
+                buf = f.read()
+            m = _CPUINFO_MODEL_RE.search(buf)
+            if m:
+                cpu_info["Model"] = m.group(1).decode("utf-8", "replace").strip()
+            # Physical cores = distinct (physical id, core id) pairs across all processor blocks
+            cores = len(set(_CPUINFO_CORE_RE.findall(buf)))
+            if not cores:
+                m = _CPUINFO_CORES_RE.search(buf)
+                cores = int(m.group(1)) if m else None
+            if not cores:
+                cores = _sysfs_core_count()
+            if cores:
+                cpu_info["Cores"] = cores
+            cpu_info["Threads"] = os.cpu_count()
+        except Exception:
+            pass
+        try:
+            # One sysfs read (kHz) instead of walking every cpu*/cpufreq directory
+            with open("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq", "r") as f:
+                khz = int(f.read().strip())
+            if khz:
+                cpu_info["Max Clock"] = f"{khz/1e6:.2f} GHz"
         except Exception:
             pass
 
@@ -174,33 +369,110 @@ def get_cpu_info():
     
     return cpu_info
 
+def _total_ram_bytes():
+    if platform.system() == "Windows":
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", wintypes.DWORD),
+                ("dwMemoryLoad", wintypes.DWORD),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+        st = MEMORYSTATUSEX()
+        st.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(st)):
+            return int(st.ullTotalPhys)
+        return None
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def _dmi_string(raw: bytes, length: int, offset: int) -> str:
+    # String fields hold a 1-based index into the NUL-separated set after the formatted area
+    if offset >= length:
+        return ""
+    idx = raw[offset]
+    if not idx:
+        return ""
+    strings = raw[length:].split(b"\0\0", 1)[0].split(b"\0")
+    if idx > len(strings):
+        return ""
+    return strings[idx - 1].decode("ascii", "replace").strip()
+
+def _read_dmi_memory_devices() -> list:
+    """Decode SMBIOS type 17 (Memory Device) entries from /sys/firmware/dmi/entries."""
+    modules = []
+    paths = glob.glob("/sys/firmware/dmi/entries/17-*/raw")
+    paths.sort(key=lambda p: int(p.split("/")[-2].split("-")[1]))
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        # Size lives at 0x0C in every version (formatted area >= 0x15); skip truncated records
+        if len(raw) < 0x15 or raw[1] < 0x15 or len(raw) < raw[1]:
+            continue
+        length = raw[1]
+        size = struct.unpack_from("<H", raw, 0x0C)[0]
+        if size == 0:
+            continue  # empty slot
+        if size == 0x7FFF and length >= 0x20:
+            size_mb = struct.unpack_from("<I", raw, 0x1C)[0] & 0x7FFFFFFF
+        elif size == 0xFFFF:
+            size_mb = None
+        elif size & 0x8000:
+            size_mb = (size & 0x7FFF) / 1024  # granularity is KB
+        else:
+            size_mb = size
+        # Prefer configured speed (0x20), fallback to max speed (0x15, SMBIOS 2.3+); 0xFFFF means "see extended field"
+        speed = struct.unpack_from("<H", raw, 0x15)[0] if length >= 0x17 else 0
+        if speed == 0xFFFF and length >= 0x5C:
+            speed = struct.unpack_from("<I", raw, 0x54)[0]
+        if length >= 0x22:
+            configured = struct.unpack_from("<H", raw, 0x20)[0]
+            if configured == 0xFFFF and length >= 0x5C:
+                configured = struct.unpack_from("<I", raw, 0x58)[0]
+            if configured and configured != 0xFFFF:
+                speed = configured
+        modules.append({
+            "Manufacturer": _dmi_string(raw, length, 0x17) or "N/A",
+            "Capacity": _fmt_gb_from_bytes(size_mb * 1024**2) if size_mb is not None else "N/A",
+            "Speed": f"{speed} MHz" if speed and speed != 0xFFFF else "N/A",
+            "Part Number": _dmi_string(raw, length, 0x1A) or "N/A",
+        })
+    return modules
+
 def get_ram_info():
-    ram_info = {"Total RAM": f"{psutil.virtual_memory().total / (1024**3):.1f} GB", "Modules": []}
+    total = _total_ram_bytes()
+    ram_info = {"Total RAM": f"{total / (1024**3):.1f} GB" if total else "N/A", "Modules": []}
     
     if platform.system() == "Windows":
         try:
-            c = wmi.WMI()
-            modules = c.Win32_PhysicalMemory()
+            modules = _wmi_query(WMI_CIMV2, "SELECT Manufacturer,ConfiguredClockSpeed,Speed,PartNumber,Capacity FROM Win32_PhysicalMemory")
             for i, module in enumerate(modules, 1):
-                manu = (module.Manufacturer or "").strip()
+                manu = (module.get("Manufacturer") or "").strip()
                 if not manu or manu.upper() in {"UNKNOWN", "N/A", "UNDEFINED", "NOT SPECIFIED", "INVALID"}:
                     manu = "N/A"
                 # Prefer ConfiguredClockSpeed, fallback to Speed
                 speed_val = None
                 try:
-                    speed_val = int(module.ConfiguredClockSpeed) if module.ConfiguredClockSpeed else None
+                    speed_val = int(module.get("ConfiguredClockSpeed")) if module.get("ConfiguredClockSpeed") else None
                 except Exception:
                     speed_val = None
                 if not speed_val:
                     try:
-                        speed_val = int(module.Speed) if module.Speed else None
+                        speed_val = int(module.get("Speed")) if module.get("Speed") else None
                     except Exception:
                         speed_val = None
                 speed_str = f"{speed_val} MHz" if speed_val else "N/A"
-                part = (module.PartNumber or "").strip() or "N/A"
+                part = (module.get("PartNumber") or "").strip() or "N/A"
                 cap_gb = "N/A"
                 try:
-                    cap_gb = f"{int(module.Capacity) / (1024**3):.1f} GB"
+                    cap_gb = f"{int(module.get('Capacity')) / (1024**3):.1f} GB"
                 except Exception:
                     pass
                 ram_info["Modules"].append({
@@ -214,32 +486,41 @@ def get_ram_info():
             pass
     else:
         try:
-            result = subprocess.check_output("sudo dmidecode --type 17", shell=True, text=True, stderr=subprocess.DEVNULL)
+            # Kernel-exported SMBIOS tables first; dmidecode needs sudo
+            modules = _read_dmi_memory_devices()
+        except Exception:
             modules = []
-            current_module = {}
-            for line in result.split("\n"):
-                if "Size:" in line and "No Module Installed" not in line:
-                    current_module["Capacity"] = line.split(":")[1].strip()
-                elif "Speed:" in line:
-                    current_module["Speed"] = line.split(":")[1].strip()
-                elif "Part Number:" in line:
-                    current_module["Part Number"] = line.split(":")[1].strip()
-                elif "Manufacturer:" in line:
-                    current_module["Manufacturer"] = line.split(":")[1].strip()
-                elif "Memory Device" in line and current_module:
-                    modules.append(current_module)
-                    current_module = {}
-            
+        if modules:
             for i, module in enumerate(modules, 1):
-                ram_info["Modules"].append({
-                    "Module": i,
-                    "Manufacturer": module.get("Manufacturer", "N/A"),
-                    "Capacity": module.get("Capacity", "N/A"),
-                    "Speed": module.get("Speed", "N/A"),
-                    "Part Number": module.get("Part Number", "N/A")
-                })
-        except Exception:
-            pass
+                ram_info["Modules"].append({"Module": i, **module})
+        else:
+            try:
+                result = subprocess.run(["sudo", "dmidecode", "--type", "17"], capture_output=True, text=True, check=False).stdout
+                modules = []
+                current_module = {}
+                for line in result.split("\n"):
+                    if "Size:" in line and "No Module Installed" not in line:
+                        current_module["Capacity"] = line.split(":")[1].strip()
+                    elif "Speed:" in line:
+                        current_module["Speed"] = line.split(":")[1].strip()
+                    elif "Part Number:" in line:
+                        current_module["Part Number"] = line.split(":")[1].strip()
+                    elif "Manufacturer:" in line:
+                        current_module["Manufacturer"] = line.split(":")[1].strip()
+                    elif "Memory Device" in line and current_module:
+                        modules.append(current_module)
+                        current_module = {}
+            
+                for i, module in enumerate(modules, 1):
+                    ram_info["Modules"].append({
+                        "Module": i,
+                        "Manufacturer": module.get("Manufacturer", "N/A"),
+                        "Capacity": module.get("Capacity", "N/A"),
+                        "Speed": module.get("Speed", "N/A"),
+                        "Part Number": module.get("Part Number", "N/A")
+                    })
+            except Exception:
+                pass
 
     # Post-process for simpler vendor/model names and CAS Latency
     for m in ram_info["Modules"]:
@@ -295,10 +576,8 @@ def get_ram_info():
             # Look for C30, CL30, C32, etc. usually near end or after hyphen
             # Regex: C followed by 2 digits, ensure it's not part of a larger number like C12345
             # common patterns: ...C30..., ...CL30...
-            match_cl = re.search(r"(?:C|CL)(\d{2})(?:[^0-9]|$)", u_part)
-            if not match_cl:
-                # Fallback: check if the string STARTS with C/CL + digits (rare but safe)
-                match_cl = re.match(r"^(?:C|CL)(\d{2})(?:[^0-9]|$)", u_part)
+            # (search also covers a match at the start of the string)
+            match_cl = _RAM_CL_RE.search(u_part)
             
             if match_cl:
                 try:
@@ -322,7 +601,14 @@ def get_ram_info():
 
     return ram_info
 
-def get_gpu_info():
+# lspci -nn trailing "[xxxx]" code; display controller classes: VGA, 3D, other
+_PCI_ID_RE = re.compile(r"\s*\[([0-9a-fA-F]{4})\]$")
+_PCI_DISPLAY_CLASSES = {"0300", "0302", "0380"}
+
+_NVIDIA_VENDOR_ID = 0x10DE
+
+@functools.lru_cache(maxsize=1)
+def _probe_gpu_info():
     gpu_info = []
     global GPU_DEBUG
     GPU_DEBUG = []
@@ -348,12 +634,17 @@ def get_gpu_info():
                             mem_bytes = int(desc.DedicatedVideoMemory)
                         except Exception:
                             mem_bytes = 0
+                        try:
+                            vendor_id = int(desc.VendorId)
+                        except Exception:
+                            vendor_id = None
                         vram_str = _fmt_gb_from_bytes(mem_bytes)
                         model = desc.Description.strip()
                         dxgi_gpus.append({
                             "Model": model,
                             "VRAM": vram_str,
                             "_bytes": mem_bytes,
+                            "_vendor": vendor_id,
                         })
                         if _is_debug_gpu():
                             GPU_DEBUG.append(f"DXGI[{idx}]: model='{model}' mem_bytes={mem_bytes} -> {vram_str}")
@@ -363,99 +654,99 @@ def get_gpu_info():
             except Exception as e:
                 if _is_debug_gpu():
                     GPU_DEBUG.append(f"DXGI: failed to create factory: {e}")
-        
-        # NVML (NVIDIA) for accurate VRAM
-        nvml_gpus = []
-        try:
-            import pynvml as N
-            N.nvmlInit()
-            try:
-                count = N.nvmlDeviceGetCount()
-                if _is_debug_gpu():
-                    GPU_DEBUG.append(f"NVML: init ok, count={count}")
-                for i in range(count):
-                    h = N.nvmlDeviceGetHandleByIndex(i)
-                    raw_name = N.nvmlDeviceGetName(h)
-                    name = raw_name.decode() if hasattr(raw_name, "decode") else str(raw_name)
-                    mem = int(N.nvmlDeviceGetMemoryInfo(h).total)
-                    vram_str = _fmt_gb_from_bytes(mem)
-                    nvml_gpus.append({
-                        "Model": name,
-                        "VRAM": vram_str,
-                        "_bytes": mem,
-                    })
-                    if _is_debug_gpu():
-                        GPU_DEBUG.append(f"NVML[{i}]: model='{name}' mem_bytes={mem} -> {vram_str}")
-            finally:
-                try:
-                    N.nvmlShutdown()
-                except Exception:
-                    pass
-        except Exception as e:
-            if _is_debug_gpu():
-                GPU_DEBUG.append(f"NVML: not available: {e}")
 
-        # WMI to enumerate GPUs and merge info
-        try:
-            c = wmi.WMI()
-            wmi_list = []
-            for gpu in c.Win32_VideoController():
-                name = gpu.Name
-                if not name or "Microsoft" in name:
-                    continue
-                vram = None
-                chosen = None
-                # Prefer NVML match
-                match_nvml = next((g for g in nvml_gpus if g["Model"] in name or name in g["Model"]), None)
-                if match_nvml:
-                    vram = match_nvml["VRAM"]
-                    chosen = "nvml"
-                # Fallback to DXGI match
-                if not vram:
-                    match_dxgi = next((g for g in dxgi_gpus if g["Model"] in name or name in g["Model"]), None)
-                    if match_dxgi:
-                        vram = match_dxgi["VRAM"]
-                        chosen = "dxgi"
-                # Fallback to AdapterRAM
-                if not vram and getattr(gpu, "AdapterRAM", None):
-                    try:
-                        mem = int(gpu.AdapterRAM)
-                        vram = _fmt_gb_from_bytes(mem)
-                        chosen = "wmi"
-                    except Exception:
-                        vram = None
-                wmi_list.append({"Model": name, "VRAM": vram or "N/A"})
+        # Fast path: DXGI reports model and dedicated VRAM for every adapter in one pass
+        dxgi_real = [g for g in dxgi_gpus if g["Model"] and "Microsoft" not in g["Model"]]
+        if any(g["_bytes"] > 0 for g in dxgi_real):
+            gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in dxgi_real]
+            if _is_debug_gpu():
+                GPU_DEBUG.append("DXGI: fast path, NVML/WMI skipped")
+        else:
+            # NVML (NVIDIA) for accurate VRAM; loading nvml.dll is pointless when DXGI
+            # enumerated adapters and none of them is NVIDIA
+            nvml_gpus = []
+            if dxgi_gpus and not any(g["_vendor"] == _NVIDIA_VENDOR_ID for g in dxgi_gpus):
                 if _is_debug_gpu():
-                    aram = None
+                    GPU_DEBUG.append("NVML: skipped, DXGI reports no NVIDIA adapter")
+            else:
+                try:
+                    import pynvml as N
+                    N.nvmlInit()
                     try:
-                        aram = int(gpu.AdapterRAM)
-                    except Exception:
-                        aram = None
-                    GPU_DEBUG.append(
-                        f"WMI: name='{name}' AdapterRAM={aram} match_nvml={'yes' if match_nvml else 'no'} match_dxgi={'yes' if 'match_dxgi' in locals() and match_dxgi else 'no'} chosen={chosen or 'none'} -> {vram or 'N/A'}"
-                    )
+                        count = N.nvmlDeviceGetCount()
+                        if _is_debug_gpu():
+                            GPU_DEBUG.append(f"NVML: init ok, count={count}")
+                        for i in range(count):
+                            h = N.nvmlDeviceGetHandleByIndex(i)
+                            raw_name = N.nvmlDeviceGetName(h)
+                            name = raw_name.decode() if hasattr(raw_name, "decode") else str(raw_name)
+                            mem = int(N.nvmlDeviceGetMemoryInfo(h).total)
+                            vram_str = _fmt_gb_from_bytes(mem)
+                            nvml_gpus.append({
+                                "Model": name,
+                                "VRAM": vram_str,
+                                "_bytes": mem,
+                            })
+                            if _is_debug_gpu():
+                                GPU_DEBUG.append(f"NVML[{i}]: model='{name}' mem_bytes={mem} -> {vram_str}")
+                    finally:
+                        try:
+                            N.nvmlShutdown()
+                        except Exception:
+                            pass
+                except Exception as e:
+                    if _is_debug_gpu():
+                        GPU_DEBUG.append(f"NVML: not available: {e}")
 
-            if wmi_list:
-                gpu_info = wmi_list
-            elif nvml_gpus:
-                gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in nvml_gpus]
-            else:
-                gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in dxgi_gpus]
-        except Exception as e:
             if nvml_gpus:
                 gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in nvml_gpus]
             else:
-                gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in dxgi_gpus]
-            if _is_debug_gpu():
-                GPU_DEBUG.append(f"WMI: failed to enumerate: {e}")
+                # WMI to enumerate GPUs. No DXGI merge here: this branch only runs when no real
+                # DXGI adapter reported VRAM, so AdapterRAM is the only source left.
+                try:
+                    wmi_list = []
+                    for gpu in _wmi_query(WMI_CIMV2, "SELECT Name,AdapterRAM FROM Win32_VideoController"):
+                        name = gpu.get("Name")
+                        if not name or "Microsoft" in name:
+                            continue
+                        vram = None
+                        aram = None
+                        if gpu.get("AdapterRAM"):
+                            try:
+                                aram = int(gpu.get("AdapterRAM"))
+                                vram = _fmt_gb_from_bytes(aram)
+                            except Exception:
+                                vram = None
+                        wmi_list.append({"Model": name, "VRAM": vram or "N/A"})
+                        if _is_debug_gpu():
+                            GPU_DEBUG.append(f"WMI: name='{name}' AdapterRAM={aram} -> {vram or 'N/A'}")
+
+                    if wmi_list:
+                        gpu_info = wmi_list
+                    else:
+                        gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in dxgi_gpus]
+                except Exception as e:
+                    gpu_info = [{"Model": g["Model"], "VRAM": g["VRAM"]} for g in dxgi_gpus]
+                    if _is_debug_gpu():
+                        GPU_DEBUG.append(f"WMI: failed to enumerate: {e}")
     else:
         # Linux implementation
         try:
-            result = subprocess.check_output("lspci | grep -i 'vga|3d|display'", shell=True, text=True)
-            for line in result.split("\n"):
-                if line.strip():
-                    model = line.split(":")[2].strip()
-                    gpu_info.append({"Model": model, "VRAM": "N/A"})
+            # -mm: quoted machine-readable fields; -nn: append [class]/[id] codes
+            result = subprocess.run(["lspci", "-mm", "-nn"], capture_output=True, text=True, check=False).stdout
+            for line in result.splitlines():
+                try:
+                    fields = shlex.split(line)
+                except ValueError:
+                    continue
+                if len(fields) < 4:
+                    continue
+                m = _PCI_ID_RE.search(fields[1])
+                if not m or m.group(1).lower() not in _PCI_DISPLAY_CLASSES:
+                    continue
+                vendor = _PCI_ID_RE.sub("", fields[2]).strip()
+                device = _PCI_ID_RE.sub("", fields[3]).strip()
+                gpu_info.append({"Model": f"{vendor} {device}".strip(), "VRAM": "N/A"})
         except Exception:
             pass
 
@@ -469,23 +760,136 @@ def get_gpu_info():
 
     return gpu_info
 
+# Hardware identity does not change during a run; probe once and hand out copies
+def get_system_info():
+    return dict(_probe_system_info())
+
+def get_cpu_info():
+    return dict(_probe_cpu_info())
+
+def get_gpu_info():
+    return [dict(g) for g in _probe_gpu_info()]
+
+def refresh():
+    """Drop memoized hardware probes so the next get_* call re-detects."""
+    _probe_system_info.cache_clear()
+    _probe_cpu_info.cache_clear()
+    _probe_gpu_info.cache_clear()
+
+def _run_probe(fn):
+    if platform.system() != "Windows":
+        return fn()
+    # Worker threads need their own COM apartment for DXGI
+    pythoncom.CoInitializeEx(0)
+    try:
+        return fn()
+    finally:
+        pythoncom.CoUninitialize()
+
+def collect_all():
+    """Run the independent hardware probes concurrently; returns (system, cpu, ram, gpu, disk)."""
+    getters = (get_system_info, get_cpu_info, get_ram_info, get_gpu_info, get_disk_info)
+    results = [None] * len(getters)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(getters)) as ex:
+        futures = {ex.submit(_run_probe, fn): i for i, fn in enumerate(getters)}
+        for fut in concurrent.futures.as_completed(futures):
+            results[futures[fut]] = fut.result()
+    return tuple(results)
+
+_IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+_IOCTL_DISK_GET_DRIVE_GEOMETRY_EX = 0x000700A0
+_STORAGE_DEVICE_PROPERTY = 0
+_STORAGE_DEVICE_SEEK_PENALTY_PROPERTY = 7
+_BUS_TYPE_NVME = 17
+
+def _win_physical_disks(max_drives: int = 32) -> list:
+    """Enumerate \\\\.\\PhysicalDriveN via DeviceIoControl: model, size and seek penalty."""
+    k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    k32.CreateFileW.restype = wintypes.HANDLE
+    k32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+                                wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    k32.DeviceIoControl.restype = wintypes.BOOL
+    k32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+                                    ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p]
+    k32.CloseHandle.argtypes = [wintypes.HANDLE]
+    invalid_handle = wintypes.HANDLE(-1).value
+    file_share_rw = 0x1 | 0x2
+    open_existing = 3
+
+    def ioctl(handle, code, in_bytes, out_size):
+        inbuf = ctypes.create_string_buffer(in_bytes, len(in_bytes)) if in_bytes else None
+        outbuf = ctypes.create_string_buffer(out_size)
+        returned = wintypes.DWORD(0)
+        ok = k32.DeviceIoControl(handle, code, inbuf, len(in_bytes or b""), outbuf, out_size, ctypes.byref(returned), None)
+        return outbuf.raw[:returned.value] if ok else None
+
+    def c_str(buf, off):
+        if not off or off >= len(buf):
+            return ""
+        end = buf.find(b"\0", off)
+        return buf[off:end if end != -1 else len(buf)].decode("ascii", "replace").strip()
+
+    disks = []
+    for n in range(max_drives):
+        # Zero access rights: enough for these IOCTLs and does not require admin
+        handle = k32.CreateFileW(f"\\\\.\\PhysicalDrive{n}", 0, file_share_rw, None, open_existing, 0, None)
+        if not handle or handle == invalid_handle:
+            continue
+        try:
+            geo = ioctl(handle, _IOCTL_DISK_GET_DRIVE_GEOMETRY_EX, None, 256)
+            if not geo or len(geo) < 32:
+                continue  # no media (e.g. empty card reader)
+            # DISK_GEOMETRY_EX: DISK_GEOMETRY (24 bytes), then LARGE_INTEGER DiskSize
+            size_val = struct.unpack_from("<q", geo, 24)[0]
+            # STORAGE_PROPERTY_QUERY {PropertyId, QueryType=PropertyStandardQuery, AdditionalParameters[1]}
+            desc = ioctl(handle, _IOCTL_STORAGE_QUERY_PROPERTY, struct.pack("<II4x", _STORAGE_DEVICE_PROPERTY, 0), 1024)
+            vendor = product = ""
+            bus_type = None
+            if desc and len(desc) >= 36:
+                # STORAGE_DEVICE_DESCRIPTOR: VendorIdOffset @12, ProductIdOffset @16, BusType @28
+                vendor_off, product_off = struct.unpack_from("<II", desc, 12)
+                bus_type = struct.unpack_from("<I", desc, 28)[0]
+                vendor = c_str(desc, vendor_off)
+                product = c_str(desc, product_off)
+            model = product or vendor
+            if vendor and product and vendor.upper() not in {"ATA", "NVME"} and vendor.upper() not in product.upper():
+                model = f"{vendor} {product}"
+            # DEVICE_SEEK_PENALTY_DESCRIPTOR: Version, Size, BOOLEAN IncursSeekPenalty @8
+            seek = ioctl(handle, _IOCTL_STORAGE_QUERY_PROPERTY, struct.pack("<II4x", _STORAGE_DEVICE_SEEK_PENALTY_PROPERTY, 0), 12)
+            if seek and len(seek) >= 9:
+                disk_type = "HDD" if seek[8] else "SSD"
+            elif bus_type == _BUS_TYPE_NVME or "NVME" in model.upper() or "SSD" in model.upper():
+                disk_type = "SSD"
+            else:
+                disk_type = "N/A"
+            disks.append({"Model": model or "N/A", "Size": f"{size_val / (1024**3):.1f} GB", "Type": disk_type})
+        finally:
+            k32.CloseHandle(handle)
+    return disks
+
 def get_disk_info():
     disk_info = []
     if platform.system() == "Windows":
+        # 0) Fast path: storage IOCTLs per physical drive, no WMI or PowerShell
+        try:
+            disk_info = _win_physical_disks()
+        except Exception:
+            disk_info = []
+        if disk_info:
+            return disk_info
         # 1) Preferred: MSFT_PhysicalDisk (CIM) -> MediaType
         try:
-            c2 = wmi.WMI(namespace=r"root\\Microsoft\\Windows\\Storage")
-            for pd in c2.MSFT_PhysicalDisk():
+            for pd in _wmi_query(WMI_STORAGE, "SELECT FriendlyName,Model,Size,MediaType,SpindleSpeed FROM MSFT_PhysicalDisk"):
                 # Size
                 try:
-                    size_val = int(pd.Size) if getattr(pd, "Size", None) else None
+                    size_val = int(pd.get("Size")) if pd.get("Size") else None
                 except Exception:
                     size_val = None
                 size_str = f"{size_val / (1024**3):.1f} GB" if size_val is not None else "N/A"
                 # MediaType mapping: 3=HDD, 4=SSD, 5=SCM (treat as SSD)
                 disk_type = "N/A"
                 try:
-                    mt = int(getattr(pd, "MediaType", 0))
+                    mt = int(pd.get("MediaType", 0))
                     if mt == 3:
                         disk_type = "HDD"
                     elif mt in (4, 5):
@@ -495,22 +899,27 @@ def get_disk_info():
                 # Fallback hint via SpindleSpeed (0 -> SSD, >0 -> HDD)
                 if disk_type == "N/A":
                     try:
-                        sp = int(getattr(pd, "SpindleSpeed", 0))
+                        sp = int(pd.get("SpindleSpeed", 0))
                         if sp > 0:
                             disk_type = "HDD"
                         elif sp == 0:
                             disk_type = "SSD"
                     except Exception:
                         pass
-                name = (getattr(pd, "FriendlyName", None) or getattr(pd, "Model", None) or "N/A").strip()
+                name = (pd.get("FriendlyName") or pd.get("Model") or "N/A").strip()
                 disk_info.append({"Model": name, "Size": size_str, "Type": disk_type})
             if disk_info:
                 return disk_info
+        except TimeoutError:
+            # The Storage provider is hung; Get-PhysicalDisk goes through it too
+            pass
         except Exception:
             # 2) Fallback: PowerShell Get-PhysicalDisk (Storage module)
             try:
-                ps = 'powershell -NoProfile -Command "Get-PhysicalDisk | Select-Object FriendlyName, MediaType, Size | ConvertTo-Json -Compress"'
-                out = subprocess.check_output(ps, shell=True, text=True, stderr=subprocess.DEVNULL)
+                # No shell: on timeout the kill must reach powershell itself, or its open pipe keeps us waiting
+                ps = ["powershell", "-NoProfile", "-Command",
+                      "Get-PhysicalDisk | Select-Object FriendlyName, MediaType, Size | ConvertTo-Json -Compress"]
+                out = subprocess.check_output(ps, text=True, stderr=subprocess.DEVNULL, timeout=_powershell_timeout())
                 items = json.loads(out) if out and out.strip() else []
                 if isinstance(items, dict):
                     items = [items]
@@ -536,13 +945,12 @@ def get_disk_info():
                 pass
         # 3) Last resort: Win32_DiskDrive with NVMe/SSD heuristics
         try:
-            c = wmi.WMI()
-            for disk in c.Win32_DiskDrive():
-                if disk.Size:
-                    size_gb = int(disk.Size) / (1024**3)
-                    model = (disk.Model or "").strip()
-                    pnp = (getattr(disk, "PNPDeviceID", "") or "").upper()
-                    serial = (getattr(disk, "SerialNumber", "") or "").upper()
+            for disk in _wmi_query(WMI_CIMV2, "SELECT Model,Size,PNPDeviceID,SerialNumber FROM Win32_DiskDrive"):
+                if disk.get("Size"):
+                    size_gb = int(disk.get("Size")) / (1024**3)
+                    model = (disk.get("Model") or "").strip()
+                    pnp = (disk.get("PNPDeviceID", "") or "").upper()
+                    serial = (disk.get("SerialNumber", "") or "").upper()
                     mdl_u = model.upper()
                     # Heuristics: NVMe implies SSD; model containing SSD also implies SSD
                     if "NVME" in pnp or "NVME" in mdl_u or "NVME" in serial:
@@ -556,21 +964,53 @@ def get_disk_info():
             pass
     else:
         try:
-            result = subprocess.check_output("lsblk -d -o NAME,MODEL,SIZE,ROTA", shell=True, text=True)
-            lines = result.split("\n")[1:]  # Skip header
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        model = " ".join(parts[1:-2])
-                        size = parts[-2]
-                        disk_type = "SSD" if parts[-1] == "0" else "HDD"
-                        disk_info.append({"Model": model, "Size": size, "Type": disk_type})
+            result = subprocess.run(["lsblk", "-d", "-b", "-J", "-o", "NAME,MODEL,SIZE,ROTA"], capture_output=True, text=True, check=False).stdout
+            for dev in json.loads(result).get("blockdevices", []):
+                model = (dev.get("model") or "").strip()
+                # Older lsblk emits numbers and booleans as strings
+                rota = dev.get("rota")
+                rotational = rota is True or str(rota).strip().lower() in {"1", "true"}
+                disk_type = "HDD" if rotational else "SSD"
+                disk_info.append({"Model": model, "Size": _fmt_gb_from_bytes(dev.get("size")), "Type": disk_type})
         except Exception:
             pass
     return disk_info
 
-def generate_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=None):
+# Static pieces of the HTML report, built once at import
+_REPORT_CSS = """
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                margin: 40px;
+                background-color: #1a1a1a;
+                color: #ffffff;
+            }
+            .container { max-width: 1000px; margin: 0 auto; }
+            .section {
+                background-color: #2d2d2d;
+                padding: 20px;
+                margin-bottom: 20px;
+                border-radius: 8px;
+            }
+            h1 { color: #00ff9d; text-align: center; }
+            h2 { color: #00ccff; border-bottom: 2px solid #3d3d3d; }
+            table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+            td, th { padding: 12px; text-align: left; border-bottom: 1px solid #3d3d3d; }
+            th { background-color: #333333; }
+            .footer { text-align: center; margin-top: 30px; color: #888; }
+        </style>
+"""
+_ROW2 = "<tr><td>{}</td><td>{}</td></tr>"
+_ROW3 = "<tr><td>{}</td><td>{}</td><td>{}</td></tr>"
+_ROW5 = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+_GPU_DEBUG_ROW = '<tr><td style="color:#888;">{:02d}</td><td>{}</td></tr>'
+_SECTION_END = "</table></div>"
+_RAM_HEADER = "<tr><th>Module</th><th>Manufacturer</th><th>Capacity</th><th>Speed</th><th>Part Number</th></tr>"
+_GPU_HEADER = '<div class="section"><h2>Graphics Card (GPU)</h2><table><tr><th>Model</th><th>VRAM</th></tr>'
+_DISK_HEADER = '<div class="section"><h2>Storage Devices</h2><table><tr><th>Model</th><th>Size</th><th>Type</th></tr>'
+
+def iter_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=None):
+    """Yield the HTML report section by section, e.g. for fh.write() without building one string."""
     # Load config if not provided
     if config is None:
         try:
@@ -580,116 +1020,61 @@ def generate_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, c
 
     title = config.get("title", "Gaming PC")
 
-    # Build optional motherboard debug section
-    debug_rows = [(k, v) for k, v in system_info.items() if str(k).startswith("Debug:")]
-    debug_html = ""
+    # Split motherboard debug rows from regular rows in one pass
+    debug_rows, normal_rows = [], []
+    for k, v in system_info.items():
+        (debug_rows if k.startswith("Debug:") else normal_rows).append((k, v))
+
+    yield "<!DOCTYPE html>\n<html>\n<head>\n"
+    yield f"<title>{title} Specifications</title>"
+    yield _REPORT_CSS
+    yield '</head>\n<body>\n<div class="container">\n'
+    yield f"<h1>🎮 {title} Specifications 🖥️</h1>\n"
+
+    yield '<div class="section"><h2>System Information</h2><table>'
+    yield "".join([_ROW2.format(k, v) for k, v in normal_rows])
+    yield _SECTION_END
+
+    yield '<div class="section"><h2>Processor (CPU)</h2><table>'
+    yield "".join([_ROW2.format(k, v) for k, v in cpu_info.items()])
+    yield _SECTION_END
+
+    yield f'<div class="section"><h2>Memory (RAM) - Total: {ram_info["Total RAM"]}</h2><table>'
+    yield _RAM_HEADER
+    yield "".join([
+        _ROW5.format(m["Module"], m["Manufacturer"], m["Capacity"], m["Speed"], m["Part Number"])
+        for m in ram_info["Modules"]
+    ])
+    yield _SECTION_END
+
+    yield _GPU_HEADER
+    yield "".join([_ROW2.format(g["Model"], g["VRAM"]) for g in gpu_info])
+    yield _SECTION_END
+
+    yield _DISK_HEADER
+    yield "".join([_ROW3.format(d["Model"], d["Size"], d["Type"]) for d in disk_info])
+    yield _SECTION_END
+
+    # Optional motherboard debug section
     if debug_rows:
-        debug_html = (
-            '<div class="section">'
-            '<h2>Debug: Motherboard Sources</h2>'
-            '<table>'
-            + ''.join(f'<tr><td>{k}</td><td>{v}</td></tr>' for k, v in debug_rows)
-            + '</table>'
-            '</div>'
-        )
-    # Build optional GPU debug section
-    gpu_debug_html = ""
+        yield '<div class="section"><h2>Debug: Motherboard Sources</h2><table>'
+        yield "".join([_ROW2.format(k, v) for k, v in debug_rows])
+        yield _SECTION_END
+    # Optional GPU debug section
     try:
         rows = list(GPU_DEBUG)
     except Exception:
         rows = []
     if rows:
-        gpu_debug_html = (
-            '<div class="section">'
-            '<h2>Debug: GPU Sources</h2>'
-            '<table>'
-            + ''.join(f'<tr><td style="color:#888;">{i+1:02d}</td><td>{line}</td></tr>' for i, line in enumerate(rows))
-            + '</table>'
-            '</div>'
-        )
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>{title} Specifications</title>
-        <style>
-            body {{ 
-                font-family: Arial, sans-serif; 
-                margin: 40px; 
-                background-color: #1a1a1a; 
-                color: #ffffff; 
-            }}
-            .container {{ max-width: 1000px; margin: 0 auto; }}
-            .section {{ 
-                background-color: #2d2d2d; 
-                padding: 20px; 
-                margin-bottom: 20px; 
-                border-radius: 8px; 
-            }}
-            h1 {{ color: #00ff9d; text-align: center; }}
-            h2 {{ color: #00ccff; border-bottom: 2px solid #3d3d3d; }}
-            table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-            td, th {{ padding: 12px; text-align: left; border-bottom: 1px solid #3d3d3d; }}
-            th {{ background-color: #333333; }}
-            .footer {{ text-align: center; margin-top: 30px; color: #888; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🎮 {title} Specifications 🖥️</h1>
-            <div class="section">
-                <h2>System Information</h2>
-                <table>
-                    {''.join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in system_info.items() if not str(key).startswith('Debug:'))}
-                </table>
-            </div>
-
-            <div class="section">
-                <h2>Processor (CPU)</h2>
-                <table>
-                    {''.join(f'<tr><td>{key}</td><td>{value}</td></tr>' for key, value in cpu_info.items())}
-                </table>
-            </div>
-
-            <div class="section">
-                <h2>Memory (RAM) - Total: {ram_info['Total RAM']}</h2>
-                <table>
-                    <tr><th>Module</th><th>Manufacturer</th><th>Capacity</th><th>Speed</th><th>Part Number</th></tr>
-                    {''.join(
-                        f'<tr><td>{m["Module"]}</td><td>{m["Manufacturer"]}</td><td>{m["Capacity"]}</td>'
-                        f'<td>{m["Speed"]}</td><td>{m["Part Number"]}</td></tr>' 
-                        for m in ram_info["Modules"])
-                    }
-                </table>
-            </div>
-
-            <div class="section">
-                <h2>Graphics Card (GPU)</h2>
-                <table>
-                    <tr><th>Model</th><th>VRAM</th></tr>
-                    {''.join(f'<tr><td>{g["Model"]}</td><td>{g["VRAM"]}</td></tr>' for g in gpu_info)}
-                </table>
-            </div>
-
-            <div class="section">
-                <h2>Storage Devices</h2>
-                <table>
-                    <tr><th>Model</th><th>Size</th><th>Type</th></tr>
-                    {''.join(f'<tr><td>{d["Model"]}</td><td>{d["Size"]}</td><td>{d["Type"]}</td></tr>' for d in disk_info)}
-                </table>
-            </div>
-
-            {debug_html}
-            {gpu_debug_html}
-
-            <div class="footer">
-                Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    return html
+        yield '<div class="section"><h2>Debug: GPU Sources</h2><table>'
+        yield "".join([_GPU_DEBUG_ROW.format(i + 1, line) for i, line in enumerate(rows)])
+        yield _SECTION_END
+
+    yield f'<div class="footer">Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>\n'
+    yield "</div>\n</body>\n</html>\n"
+
+def generate_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=None):
+    return "".join(iter_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=config))
 
 # ---------- Helpers for condensed share card ----------
 def _short_vendor(name: str) -> str:
@@ -715,13 +1100,13 @@ def _clean_cpu_model(name: str) -> str:
         return "N/A"
     s = name
     s = s.replace("(R)", "").replace("(TM)", "").replace("CPU", "").replace("  ", " ")
-    s = re.sub(r"with Radeon Graphics", "", s, flags=re.I)
+    s = _RADEON_RE.sub("", s)
     return s.strip()
 
 def _parse_gb(text: str) -> float:
     if not text:
         return 0.0
-    m = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*GB", str(text), re.I)
+    m = _GB_RE.search(str(text))
     return float(m.group(1)) if m else 0.0
 
 def _fmt_gb_from_bytes(b) -> str:
@@ -743,7 +1128,7 @@ def _as_rgb(val, default):
         if isinstance(val, (list, tuple)) and len(val) >= 3:
             return (int(val[0]), int(val[1]), int(val[2]))
         if isinstance(val, str):
-            m = re.match(r"#?([0-9a-fA-F]{6})", val)
+            m = _HEX6_RE.match(val)
             if m:
                 hexv = m.group(1)
                 return (int(hexv[0:2], 16), int(hexv[2:4], 16), int(hexv[4:6], 16))
@@ -759,22 +1144,33 @@ def _deep_update(base: dict, override: dict) -> dict:
             base[k] = v
     return base
 
+_DEFAULT_CFG_JSON = json.dumps({
+    "image_size": [1200, 675],
+    "background_image": "bg.jpg",
+    "background_fit": "cover",  # cover | contain | stretch
+    "image_format": "png",  # png | jpeg
+    "background_overlay": {"color": [0, 0, 0], "opacity": 0.4},
+    "background_color": [26, 26, 26],
+    "accent_color": [0, 255, 157],
+    "sub_color": [0, 204, 255],
+    "text_color": [240, 240, 240],
+    "dim_color": [160, 160, 160],
+    "font_paths": {"title": "", "h2": "", "body": "", "small": ""},
+    "font_sizes": {"title": 56, "h2": 36, "body": 28, "small": 24},
+})
+
 def _default_config() -> dict:
-    return {
-        "image_size": [1200, 675],
-        "background_image": "bg.jpg",
-        "background_fit": "cover",  # cover | contain | stretch
-        "background_overlay": {"color": [0, 0, 0], "opacity": 0.4},
-        "background_color": [26, 26, 26],
-        "accent_color": [0, 255, 157],
-        "sub_color": [0, 204, 255],
-        "text_color": [240, 240, 240],
-        "dim_color": [160, 160, 160],
-        "font_paths": {"title": "", "h2": "", "body": "", "small": ""},
-        "font_sizes": {"title": 56, "h2": 36, "body": 28, "small": 24},
-    }
+    # Fresh deep copy of the frozen defaults
+    return json.loads(_DEFAULT_CFG_JSON)
 
 def load_config(config_filename: str = "xpec.config.json") -> dict:
+    # Cached for the process lifetime; call load_config.cache_clear() to re-read from disk.
+    # Each call returns a fresh deep copy so callers can't mutate the cached config.
+    return json.loads(_load_config_json(config_filename))
+
+@functools.lru_cache(maxsize=4)
+def _load_config_json(config_filename: str) -> str:
+    # Cached for the process lifetime, frozen as JSON like _DEFAULT_CFG_JSON
     cfg = _default_config()
 
     # First: detect if running as a PyInstaller exe
@@ -786,21 +1182,22 @@ def load_config(config_filename: str = "xpec.config.json") -> dict:
         except Exception:
             base_dir = os.getcwd()
 
-    # Candidate paths: next to exe/py, then current working dir
-    paths = [
-        os.path.join(base_dir, config_filename),
-        os.path.join(os.getcwd(), config_filename)
-    ]
+    # Candidate paths: next to exe/py, then current working dir (skipped when identical)
+    paths = [os.path.join(base_dir, config_filename)]
+    cwd = os.getcwd()
+    if cwd != base_dir:
+        paths.append(os.path.join(cwd, config_filename))
 
     user_cfg = None
     for path in paths:
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    user_cfg = json.load(f)
-                break
-            except Exception:
-                pass
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                user_cfg = json.load(f)
+            break
+        except FileNotFoundError:
+            continue
+        except Exception:
+            pass
 
     if user_cfg:
         cfg = _deep_update(cfg, user_cfg)
@@ -812,10 +1209,14 @@ def load_config(config_filename: str = "xpec.config.json") -> dict:
         except Exception:
             pass
 
-    return cfg
+    return json.dumps(cfg)
 
+load_config.cache_clear = _load_config_json.cache_clear
 
-def _load_font(path: str, size: int):
+
+@functools.lru_cache(maxsize=64)
+def _load_font_cached(path: str, size: int):
+    # FreeType parses the face on every truetype() call; fonts are safe to share across Draw objects
     try:
         if path and os.path.exists(path):
             return ImageFont.truetype(path, size)
@@ -830,10 +1231,86 @@ def _load_font(path: str, size: int):
         pass
     return ImageFont.load_default()
 
+def _load_font(path: str, size: int):
+    return _load_font_cached(path or "", int(size))
+
+# Below this pixel count Image.blend is already cheap enough
+_JIT_BLEND_MIN_PIXELS = 1920 * 1080
+
+@functools.lru_cache(maxsize=1)
+def _jit_blend_kernel():
+    # numba/numpy are optional and slow to import; only pulled in for large canvases.
+    # Any failure (missing package, unwritable JIT cache in a frozen build) means Image.blend.
+    try:
+        import numba
+        import numpy as np
+
+        @numba.njit(parallel=True, cache=True)
+        def blend_const_rgb(arr, r, g, b, a):
+            # In place, fixed point: out = (px * (256 - a) + c * a) >> 8
+            H, W, _ = arr.shape
+            inv = 256 - a
+            for y in numba.prange(H):
+                for x in range(W):
+                    arr[y, x, 0] = (arr[y, x, 0] * inv + r * a) >> 8
+                    arr[y, x, 1] = (arr[y, x, 1] * inv + g * a) >> 8
+                    arr[y, x, 2] = (arr[y, x, 2] * inv + b * a) >> 8
+
+        # Compile now (same signature as real calls) so JIT/cache errors land here, once
+        blend_const_rgb(np.zeros((1, 1, 3), dtype=np.uint8), 0, 0, 0, 128)
+    except Exception:
+        return None
+    return np, blend_const_rgb
+
+def _blend_overlay(img, color: tuple, alpha: float):
+    # Uniform colour at uniform opacity over an RGB image
+    W, H = img.size
+    if W * H >= _JIT_BLEND_MIN_PIXELS:
+        jit = _jit_blend_kernel()
+        if jit is not None:
+            np, kernel = jit
+            try:
+                arr = np.array(img)  # writable copy; np.asarray over a PIL image is read-only
+                r, g, b = color
+                kernel(arr, r, g, b, int(round(256 * alpha)))
+                return Image.fromarray(arr)
+            except Exception:
+                pass
+    return Image.blend(img, Image.new("RGB", (W, H), color), alpha)
+
+def _prereduce(src, scale: float):
+    # Heavy downscale: box-reduce by the largest power of 2 <= 1/scale so LANCZOS
+    # only has to cover the remaining <2x step
+    if scale >= 0.5:
+        return src
+    factor = 1
+    while factor * 2 <= 1 / scale:
+        factor *= 2
+    try:
+        return src.reduce(factor)
+    except Exception:
+        return src
+
+# Solid bg_color canvases for contain-mode letterboxing, reused via copy()
+_SCRATCH = {}
+_SCRATCH_MAX = 8
+
+def _scratch_canvas(size: tuple, bg_color: tuple):
+    key = (size, bg_color)
+    base = _SCRATCH.get(key)
+    if base is None:
+        if len(_SCRATCH) >= _SCRATCH_MAX:
+            _SCRATCH.clear()
+        base = _SCRATCH[key] = Image.new("RGB", size, bg_color)
+    return base.copy()
+
 def _apply_background(img_path: str, size: tuple, bg_color: tuple, fit: str, overlay_color: tuple, overlay_opacity: float):
     W, H = size
     try:
-        src = Image.open(img_path).convert("RGB")
+        src = Image.open(img_path)
+        # JPEG only (no-op otherwise): let libjpeg decode at 1/2, 1/4 or 1/8 scale, still >= (W, H)
+        src.draft("RGB", (W, H))
+        src = src.convert("RGB")
     except Exception:
         return Image.new("RGB", (W, H), bg_color)
     sw, sh = src.size
@@ -844,48 +1321,77 @@ def _apply_background(img_path: str, size: tuple, bg_color: tuple, fit: str, ove
     elif fit_mode == "contain":
         scale = min(W / sw, H / sh) if sw and sh else 1.0
         new_size = (max(1, int(sw * scale)), max(1, int(sh * scale)))
-        resized = src.resize(new_size, resample=resample)
-        canvas = Image.new("RGB", (W, H), bg_color)
-        px = (W - new_size[0]) // 2
-        py = (H - new_size[1]) // 2
-        canvas.paste(resized, (px, py))
+        resized = _prereduce(src, scale).resize(new_size, resample=resample)
+        if new_size == (W, H):
+            # Same aspect ratio: no letterbox strips, the resized image is the canvas
+            canvas = resized
+        else:
+            canvas = _scratch_canvas((W, H), bg_color)
+            px = (W - new_size[0]) // 2
+            py = (H - new_size[1]) // 2
+            canvas.paste(resized, (px, py))
     else:  # cover
         scale = max(W / sw, H / sh) if sw and sh else 1.0
         new_size = (max(1, int(sw * scale)), max(1, int(sh * scale)))
-        resized = src.resize(new_size, resample=resample)
+        resized = _prereduce(src, scale).resize(new_size, resample=resample)
         # center crop
         left = (new_size[0] - W) // 2
         top = (new_size[1] - H) // 2
         canvas = resized.crop((left, top, left + W, top + H))
-    # Overlay
+    # Overlay: a uniform colour at uniform opacity is a plain lerp, no RGBA round-trip needed
     try:
         if overlay_opacity and overlay_opacity > 0:
-            overlay = Image.new("RGBA", (W, H), overlay_color + (int(255 * min(1.0, max(0.0, overlay_opacity))),))
-            canvas = Image.alpha_composite(canvas.convert("RGBA"), overlay).convert("RGB")
+            alpha = min(1.0, max(0.0, overlay_opacity))
+            canvas = _blend_overlay(canvas, overlay_color, alpha)
     except Exception:
         pass
     return canvas
 
+# Composited backgrounds keyed by file identity + render params; LRU-bounded
+_BG_CACHE = collections.OrderedDict()
+_BG_CACHE_MAX = 8
+
+def _cached_background(bg_path: str, size: tuple, bg_color: tuple, fit: str, overlay_color: tuple, overlay_opacity: float):
+    key = (os.path.abspath(bg_path), os.path.getmtime(bg_path), size, bg_color, fit, overlay_color, overlay_opacity)
+    img = _BG_CACHE.get(key)
+    if img is None:
+        img = _apply_background(bg_path, size, bg_color, fit, overlay_color, overlay_opacity)
+        _BG_CACHE[key] = img
+        if len(_BG_CACHE) > _BG_CACHE_MAX:
+            _BG_CACHE.popitem(last=False)
+    else:
+        _BG_CACHE.move_to_end(key)
+    # Callers draw on the result; never hand out the cached instance
+    return img.copy()
+
 def _summarize_ram(ram_info: dict) -> str:
     total = ram_info.get("Total RAM", "N/A")
     modules = ram_info.get("Modules", [])
     count = len(modules)
-    # derive per-module size and speed if consistent
-    sizes = []
-    speeds = []
+    # derive per-module size and speed if consistent, in a single pass
+    first_size = None
+    uniq_size_ok = True
+    first_speed = None
+    uniq_speed_ok = True
     for m in modules:
-        sizes.append(_parse_gb(m.get("Capacity", "")))
-        sp = m.get("Speed", "")
-        sm = re.search(r"(\d+)", sp)
-        speeds.append(int(sm.group(1)) if sm else None)
-    uniq_speed = None
-    filtered = [s for s in speeds if s]
-    if filtered and len(set(filtered)) == 1:
-        uniq_speed = filtered[0]
-    per_size = None
-    if count and sizes and all(x > 0 for x in sizes):
-        if len(set(sizes)) == 1:
-            per_size = sizes[0]
+        sz = _parse_gb(m.get("Capacity", ""))
+        if sz <= 0:
+            uniq_size_ok = False
+        elif first_size is None:
+            first_size = sz
+        elif sz != first_size:
+            uniq_size_ok = False
+        sm = _RAM_SPEED_RE.search(m.get("Speed", ""))
+        if sm:
+            sp = int(sm.group(1))
+            if not sp:
+                continue
+            if first_speed is None:
+                first_speed = sp
+            elif sp != first_speed:
+                uniq_speed_ok = False
+    uniq_speed = first_speed if uniq_speed_ok else None
+    per_size = first_size if count and uniq_size_ok else None
     parts = [f"{total}"]
     if count:
         if per_size:
@@ -929,79 +1435,180 @@ def _summarize_ram(ram_info: dict) -> str:
 def _choose_primary_gpu(gpu_info: list) -> dict:
     if not gpu_info:
         return {"Model": "N/A", "VRAM": "N/A"}
-    return max(gpu_info, key=lambda g: _parse_gb(g.get("VRAM", "0 GB")))
+    if len(gpu_info) == 1:
+        return gpu_info[0]
+    # Largest VRAM wins; ties keep the earlier entry, same as max()
+    best = gpu_info[0]
+    best_vram = _parse_gb(best.get("VRAM", "0 GB"))
+    for g in gpu_info[1:]:
+        vram = _parse_gb(g.get("VRAM", "0 GB"))
+        if vram > best_vram:
+            best, best_vram = g, vram
+    return best
 
 def _summarize_storage(disk_info: list) -> str:
     if not disk_info:
         return "N/A"
-    ssd = [d for d in disk_info if d.get("Type") == "SSD"]
-    hdd = [d for d in disk_info if d.get("Type") == "HDD"]
-    def total_gb(items):
-        tot = 0.0
-        for it in items:
-            tot += _parse_gb(it.get("Size", "0 GB"))
-        return tot
+    # [count, total GB] per type, accumulated in one scan
+    totals = {"SSD": [0, 0.0], "HDD": [0, 0.0]}
+    for d in disk_info:
+        t = totals.get(d.get("Type"))
+        if t is not None:
+            t[0] += 1
+            t[1] += _parse_gb(d.get("Size", "0 GB"))
     parts = []
-    if ssd:
-        parts.append(f"{len(ssd)}x SSD ({total_gb(ssd):.1f} GB)")
-    if hdd:
-        parts.append(f"{len(hdd)}x HDD ({total_gb(hdd):.1f} GB)")
+    for kind in ("SSD", "HDD"):
+        n, gb = totals[kind]
+        if n:
+            parts.append(f"{n}x {kind} ({gb:.1f} GB)")
     return ", ".join(parts)
 
-def generate_share_image(system_info, cpu_info, ram_info, gpu_info, disk_info, outfile="pc_specs.png", config=None):
-    if not PIL_AVAILABLE:
-        return None
-    # Load config if not provided
-    if config is None:
-        try:
-            config = load_config()
-        except Exception:
-            config = {}
+# Card layout: title, then one header + value line per section on a 98px pitch
+_CARD_X = 60
+_CARD_TITLE_Y = 50
+_CARD_SECTIONS = ("GPU", "CPU", "RAM", "Motherboard", "Storage")
+_CARD_HEADER_Y0 = _CARD_TITLE_Y + 80
+_CARD_BODY_OFFSET = 48
+_CARD_ROW_STEP = 98
+
+def _row_spacing(font) -> int:
+    # multiline_text advances by the bottom of "A" plus spacing; solve for the card's row pitch
+    try:
+        return _CARD_ROW_STEP - font.getbbox("A")[3]
+    except Exception:
+        return _CARD_ROW_STEP - getattr(font, "size", 10)
+
+@dataclasses.dataclass(frozen=True)
+class _Style:
+    W: int
+    H: int
+    bg_color: tuple
+    accent: tuple
+    sub: tuple
+    text: tuple
+    dim: tuple
+    title: str
+    title_font: object
+    h2_font: object
+    body_font: object
+    small_font: object
+    bg_path: str
+    fit: str
+    overlay_color: tuple
+    overlay_opacity: float
+    jpeg: bool
+
+def _style_key(config: dict) -> str:
+    return json.dumps(config, sort_keys=True, default=str)
+
+@functools.lru_cache(maxsize=8)
+def _prepare_style(config_key: str) -> _Style:
+    # Resolve colours, sizes and fonts once per distinct config (keyed by its JSON form)
+    config = json.loads(config_key)
     size = config.get("image_size", [1200, 675])
     try:
         W, H = int(size[0]), int(size[1])
     except Exception:
         W, H = 1200, 675
-    bg_color = _as_rgb(config.get("background_color", [26, 26, 26]), (26, 26, 26))
-    accent = _as_rgb(config.get("accent_color", [0, 255, 157]), (0, 255, 157))
-    sub = _as_rgb(config.get("sub_color", [0, 204, 255]), (0, 204, 255))
-    text = _as_rgb(config.get("text_color", [240, 240, 240]), (240, 240, 240))
-    dim = _as_rgb(config.get("dim_color", [160, 160, 160]), (160, 160, 160))
-
-    img = Image.new("RGB", (W, H), bg_color)
-    bg_path = str(config.get("background_image", "") or "bg.jpg").strip()
-    fit = config.get("background_fit", "cover")
     overlay_cfg = config.get("background_overlay", {})
-    overlay_color = _as_rgb(overlay_cfg.get("color", [0, 0, 0]), (0, 0, 0))
     try:
         overlay_opacity = float(overlay_cfg.get("opacity", 0.4))
     except Exception:
         overlay_opacity = 0.0
-    if bg_path and os.path.exists(bg_path):
-        try:
-            img = _apply_background(bg_path, (W, H), bg_color, fit, overlay_color, overlay_opacity)
-        except Exception:
-            pass
-    elif overlay_opacity and overlay_opacity > 0:
-        try:
-            overlay = Image.new("RGBA", (W, H), overlay_color + (int(255 * min(1.0, max(0.0, overlay_opacity))),))
-            img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-        except Exception:
-            pass
-
-    draw = ImageDraw.Draw(img)
-    # Fonts
-    title = config.get("title", "Gaming PC")
     font_paths = config.get("font_paths", {})
     font_sizes = config.get("font_sizes", {})
     tsize = int(font_sizes.get("title", 56) or 56)
     h2size = int(font_sizes.get("h2", 36) or 36)
     bodysize = int(font_sizes.get("body", 28) or 28)
     smallsize = int(font_sizes.get("small", 24) or 24)
-    title_font = _load_font(font_paths.get("title", ""), tsize)
-    h2_font = _load_font(font_paths.get("h2", ""), h2size)
-    body_font = _load_font(font_paths.get("body", ""), bodysize)
-    small_font = _load_font(font_paths.get("small", ""), smallsize)
+    return _Style(
+        W=W,
+        H=H,
+        bg_color=_as_rgb(config.get("background_color", [26, 26, 26]), (26, 26, 26)),
+        accent=_as_rgb(config.get("accent_color", [0, 255, 157]), (0, 255, 157)),
+        sub=_as_rgb(config.get("sub_color", [0, 204, 255]), (0, 204, 255)),
+        text=_as_rgb(config.get("text_color", [240, 240, 240]), (240, 240, 240)),
+        dim=_as_rgb(config.get("dim_color", [160, 160, 160]), (160, 160, 160)),
+        title=config.get("title", "Gaming PC"),
+        title_font=_load_font(font_paths.get("title", ""), tsize),
+        h2_font=_load_font(font_paths.get("h2", ""), h2size),
+        body_font=_load_font(font_paths.get("body", ""), bodysize),
+        small_font=_load_font(font_paths.get("small", ""), smallsize),
+        bg_path=str(config.get("background_image", "") or "bg.jpg").strip(),
+        fit=config.get("background_fit", "cover"),
+        overlay_color=_as_rgb(overlay_cfg.get("color", [0, 0, 0]), (0, 0, 0)),
+        overlay_opacity=overlay_opacity,
+        jpeg=str(config.get("image_format", "png") or "png").strip().lower() in ("jpeg", "jpg"),
+    )
+
+# Pre-rendered static card (background, overlay, title, section headers) per style
+_TEMPLATE_CACHE = collections.OrderedDict()
+_TEMPLATE_CACHE_MAX = 4
+
+def _build_template(style: _Style):
+    W, H = style.W, style.H
+    fill = style.bg_color
+    if style.bg_path and os.path.exists(style.bg_path):
+        try:
+            img = _cached_background(style.bg_path, (W, H), style.bg_color, style.fit, style.overlay_color, style.overlay_opacity)
+        except Exception:
+            img = None
+    else:
+        img = None
+        if style.overlay_opacity and style.overlay_opacity > 0:
+            # Uniform overlay on a solid colour is itself a solid colour (truncated like Image.blend)
+            alpha = min(1.0, max(0.0, style.overlay_opacity))
+            fill = tuple(int(b + alpha * (o - b)) for b, o in zip(style.bg_color, style.overlay_color))
+    if img is None:
+        img = Image.new("RGB", (W, H), fill)
+
+    # Static text; the template is copied per card and each copy gets its own (single) Draw
+    draw = ImageDraw.Draw(img, "RGB")
+    draw.text((_CARD_X, _CARD_TITLE_Y), style.title, fill=style.accent, font=style.title_font)
+    draw.multiline_text((_CARD_X, _CARD_HEADER_Y0), "\n".join(_CARD_SECTIONS), fill=style.sub,
+                        font=style.h2_font, spacing=_row_spacing(style.h2_font))
+    return img
+
+def _get_template(config: dict):
+    config_key = _style_key(config)
+    style = _prepare_style(config_key)
+    try:
+        bg_mtime = os.path.getmtime(style.bg_path)
+    except OSError:
+        bg_mtime = None
+    key = (config_key, os.path.abspath(style.bg_path), bg_mtime)
+    img = _TEMPLATE_CACHE.get(key)
+    if img is None:
+        img = _TEMPLATE_CACHE[key] = _build_template(style)
+        if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_MAX:
+            _TEMPLATE_CACHE.popitem(last=False)
+    else:
+        _TEMPLATE_CACHE.move_to_end(key)
+    return img, style
+
+# Footer timestamp has minute resolution; reformat only when the minute changes
+_TS_CACHE = [None, ""]
+
+def _now_str() -> str:
+    minute = int(time.time() // 60)
+    if _TS_CACHE[0] != minute:
+        _TS_CACHE[1] = datetime.now().strftime('%Y-%m-%d %H:%M')
+        _TS_CACHE[0] = minute
+    return _TS_CACHE[1]
+
+def generate_share_image(system_info, cpu_info, ram_info, gpu_info, disk_info, outfile="pc_specs.png", config=None):
+    if not PIL_AVAILABLE:
+        return None
+    # Load config if not provided
+    if config is None:
+        try:
+            config = load_config()
+        except Exception:
+            config = {}
+    template, style = _get_template(config)
+    img = template.copy()
+    # One Draw for every dynamic line and the footer; explicit mode skips inference
+    draw = ImageDraw.Draw(img, "RGB")
 
     # Content
     mobo = system_info.get("Motherboard", "N/A")
@@ -1012,26 +1619,28 @@ def generate_share_image(system_info, cpu_info, ram_info, gpu_info, disk_info, o
     gpu_line = f"{gpu_primary.get('Model', 'N/A')}  |  {gpu_primary.get('VRAM', 'N/A')} VRAM"
     storage_line = _summarize_storage(disk_info)
 
-    # Layout
-    x = 60
-    y = 50
-    draw.text((x, y), title, fill=accent, font=title_font)
-    y += 80
-    draw.text((x, y), "GPU", fill=sub, font=h2_font); y += 48
-    draw.text((x, y), gpu_line, fill=text, font=body_font); y += 50
-    draw.text((x, y), "CPU", fill=sub, font=h2_font); y += 48
-    draw.text((x, y), cpu_line, fill=text, font=body_font); y += 50
-    draw.text((x, y), "RAM", fill=sub, font=h2_font); y += 48
-    draw.text((x, y), ram_line, fill=text, font=body_font); y += 50
-    draw.text((x, y), "Motherboard", fill=sub, font=h2_font); y += 48
-    draw.text((x, y), mobo, fill=text, font=body_font); y += 50
-    draw.text((x, y), "Storage", fill=sub, font=h2_font); y += 48
-    draw.text((x, y), storage_line, fill=text, font=body_font); y += 50
+    # Layout: value line under each pre-rendered section header (same order as _CARD_SECTIONS)
+    x = _CARD_X
+    body = "\n".join(str(line).replace("\n", " ") for line in (gpu_line, cpu_line, ram_line, mobo, storage_line))
+    draw.multiline_text((x, _CARD_HEADER_Y0 + _CARD_BODY_OFFSET), body, fill=style.text,
+                        font=style.body_font, spacing=_row_spacing(style.body_font))
     # Footer
-    footer = f"{os_str}  •  Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-    draw.text((x, H - 60), footer, fill=dim, font=small_font)
+    footer = f"{os_str}  •  Generated {_now_str()}"
+    draw.text((x, style.H - 60), footer, fill=style.dim, font=style.small_font)
 
-    img.save(outfile)
+    # Fast encoder settings: zlib level 1 for PNG, or baseline JPEG when opted in
+    if style.jpeg:
+        root, ext = os.path.splitext(outfile)
+        if ext.lower() == ".png":
+            outfile = root + ".jpg"
+        fmt, opts = "JPEG", {"quality": 90, "optimize": False, "progressive": False}
+    else:
+        fmt, opts = "PNG", {"optimize": False, "compress_level": 1}
+    # Encode in memory, then hand the file one contiguous write
+    buf = io.BytesIO()
+    img.save(buf, fmt, **opts)
+    with open(outfile, "wb") as f:
+        f.write(buf.getbuffer())
     return outfile
 
 def main():
@@ -1042,22 +1651,20 @@ def main():
         cfg = None
 
     try:
-        system_info = get_system_info()
-        cpu_info = get_cpu_info()
-        ram_info = get_ram_info()
-        gpu_info = get_gpu_info()
-        disk_info = get_disk_info()
+        system_info, cpu_info, ram_info, gpu_info, disk_info = collect_all()
 
-        html_content = generate_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=cfg)
-        
         filename = "pc_specs.html"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        
-        webbrowser.open(filename)
-        
+        # Pillow's resize/encode release the GIL: render the card while the HTML is written and opened
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+            png_fut = ex.submit(generate_share_image, system_info, cpu_info, ram_info, gpu_info, disk_info, "pc_specs.png", cfg)
+            with open(filename, "w", encoding="utf-8") as f:
+                for chunk in iter_html_report(system_info, cpu_info, ram_info, gpu_info, disk_info, config=cfg):
+                    f.write(chunk)
+
+            webbrowser.open(filename)
+
         try:
-            png_path = generate_share_image(system_info, cpu_info, ram_info, gpu_info, disk_info, outfile="pc_specs.png", config=cfg)
+            png_path = png_fut.result()
             if png_path and os.name == "nt":
                 try:
                     os.startfile(png_path)